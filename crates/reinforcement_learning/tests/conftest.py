@@ -0,0 +1,106 @@
+"""
+Shared test setup for the Gymnasium wrapper.
+
+Installs a small pure-Python stand-in for the Rust ``yolo_env`` extension
+so ``yolo_gym_env`` can be imported and exercised without a maturin build.
+"""
+
+import random
+import sys
+import types
+
+_WEAPONS = ("Pistol", "Rifle", "Shotgun", "Sniper")
+
+
+class Action:
+    """Mirror of the Rust action, with the same attributes the wrapper sets."""
+
+    def __init__(self) -> None:
+        self.movement = (0.0, 0.0, 0.0)
+        self.look_direction = (0.0, 0.0)
+        self.jump = False
+        self.sprint = False
+        self.fire = False
+        self.reload = False
+        self.switch_weapon = -1
+
+
+class Observation:
+    """Deterministic observation: game_time counts ticks, the rest comes from the seeded RNG."""
+
+    def __init__(self, rng: random.Random, tick: int) -> None:
+        self.player_position = (rng.uniform(-10, 10), 1.0, rng.uniform(-10, 10))
+        self.player_health = 100.0
+        self.player_stamina = 50.0
+        self.current_weapon = rng.choice(_WEAPONS)
+        self.ammo_count = 12
+        # Sometimes more enemies than the padded buffer holds
+        self.nearby_enemies = [(rng.random(), 0.0, rng.random()) for _ in range(rng.randint(0, 12))]
+        self.nearby_players = [(1.0, 2.0, 3.0)]
+        self.game_time = float(tick)
+
+
+class StepResult:
+    """Mirror of the Rust step result."""
+
+    def __init__(self, observation: Observation, reward: float, *,
+                 terminated: bool, truncated: bool, info: dict) -> None:
+        self.observation = observation
+        self.reward = reward
+        self.terminated = terminated
+        self.truncated = truncated
+        self.info = info
+
+
+class YoloEnv:
+    """Stand-in game that truncates after ``episode_length`` ticks."""
+
+    def __init__(self, episode_length: int, max_episodes: int) -> None:
+        self.episode_length = episode_length
+        self.max_episodes = max_episodes
+        self.last_action: Action | None = None
+        self.step_count = 0
+        self._rng = random.Random()
+        self._tick = 0
+        self._episode = 0
+
+    def reset(self, seed: int | None) -> tuple[Observation, dict]:
+        self._rng = random.Random(seed)
+        self._tick = 0
+        self._episode += 1
+        return Observation(self._rng, self._tick), {"rust/episode": self._episode}
+
+    def step(self, action: Action) -> StepResult:
+        self.last_action = action
+        self.step_count += 1
+        self._tick += 1
+        return StepResult(
+            Observation(self._rng, self._tick),
+            1.0,
+            terminated=False,
+            truncated=self._tick >= self.episode_length,
+            info={"rust/kills": 0},
+        )
+
+    def get_observation(self) -> Observation:
+        return Observation(self._rng, self._tick)
+
+    def render(self, mode: str) -> None:
+        pass
+
+    def set_rewards(self, *rewards: float | None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def create_yolo_env(episode_length: int, max_episodes: int) -> YoloEnv:
+    return YoloEnv(episode_length, max_episodes)
+
+
+yolo_env = types.ModuleType("yolo_env")
+yolo_env.Action = Action
+yolo_env.create_yolo_env = create_yolo_env
+yolo_env.__build_profile__ = "release"
+sys.modules["yolo_env"] = yolo_env
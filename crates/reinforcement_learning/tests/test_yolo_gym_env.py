@@ -0,0 +1,270 @@
+"""Tests for the Gymnasium wrappers around the Yolo environment."""
+
+import importlib.util
+import sys
+import warnings
+
+import gymnasium as gym
+import numpy as np
+import pytest
+from gymnasium.utils.env_checker import check_env
+
+from yolo_gym_env import (
+    FLAT_OBSERVATION_SIZE,
+    MAX_NEARBY_ENEMIES,
+    MAX_NEARBY_PLAYERS,
+    YoloAutoreset,
+    YoloGymEnvironment,
+    YoloVectorEnv,
+    make_yolo_vec,
+)
+
+EPISODE_LENGTH = 2
+TIME_LIMIT_OVERRIDE = 5
+FRAME_SKIP = 3
+FRAME_SKIP_EPISODE_LENGTH = 5
+SAMPLED_ACTIONS = 16
+
+
+class TestYoloGymEnvironment:
+    """Observation ownership and Gymnasium API compliance of the single environment."""
+
+    @pytest.mark.parametrize("flat_obs", [False, True])
+    def test_passes_env_checker(self, flat_obs: bool) -> None:
+        check_env(YoloGymEnvironment(episode_length=EPISODE_LENGTH, flat_obs=flat_obs), skip_render_check=True)
+
+    @pytest.mark.parametrize("flat_obs", [False, True])
+    def test_observations_are_not_shared(self, flat_obs: bool) -> None:
+        env = YoloGymEnvironment(flat_obs=flat_obs)
+        first, _ = env.reset(seed=0)
+        second, *_ = env.step(env.action_space.sample())
+        if flat_obs:
+            assert not np.shares_memory(first, second)
+        else:
+            for key, value in first.items():
+                assert not np.shares_memory(value, second[key])
+
+    def test_ansi_render_returns_str(self) -> None:
+        env = YoloGymEnvironment(render_mode="ansi")
+        env.reset(seed=0)
+        frame = env.render()
+        assert isinstance(frame, str)
+        assert "Game time: 0.0s" in frame
+
+    @pytest.mark.parametrize(("value", "expected"), [(-3.0, -1), (0.5, 0), (2.5, 2), (3.4, 2), (9.0, 3)])
+    def test_flat_switch_weapon_is_clipped_and_rounded_half_up(self, value: float, expected: int) -> None:
+        env = YoloGymEnvironment(flat_action=True)
+        env.reset(seed=0)
+        action = np.zeros(env.action_space.shape, dtype=np.float32)
+        action[-1] = value
+        env.step(action)
+        assert env._yolo_env.last_action.switch_weapon == expected
+
+    @pytest.mark.parametrize("flat_action", [False, True])
+    def test_sample_actions_stay_in_action_space(self, flat_action: bool) -> None:
+        env = YoloGymEnvironment(flat_action=flat_action)
+        env.reset(seed=0)
+        # The dict mode reuses one dict, so check each action as it is yielded
+        count = 0
+        for action in env.sample_actions(SAMPLED_ACTIONS):
+            assert env.action_space.contains(action)
+            count += 1
+        assert count == SAMPLED_ACTIONS
+
+    def test_flat_observation_layout_matches_dict(self) -> None:
+        # Step once so game_time is non-zero and mislaid fields cannot match by accident
+        dict_env, flat_env = YoloGymEnvironment(), YoloGymEnvironment(flat_obs=True)
+        dict_env.reset(seed=0)
+        flat_env.reset(seed=0)
+        action = dict_env.action_space.sample()
+        observation, *_ = dict_env.step(action)
+        flat, *_ = flat_env.step(action)
+        assert flat.shape == (FLAT_OBSERVATION_SIZE,)
+
+        enemies_end = 7 + 3 * MAX_NEARBY_ENEMIES
+        players_end = enemies_end + 3 * MAX_NEARBY_PLAYERS
+        np.testing.assert_array_equal(flat[0:3], observation["player_position"])
+        assert flat[3] == observation["player_health"][0]
+        assert flat[4] == observation["player_stamina"][0]
+        assert flat[5] == observation["current_weapon"]
+        assert flat[6] == observation["ammo_count"][0]
+        np.testing.assert_array_equal(flat[7:enemies_end].reshape(-1, 3), observation["nearby_enemies"])
+        np.testing.assert_array_equal(flat[enemies_end:players_end].reshape(-1, 3), observation["nearby_players"])
+        assert flat[-1] == observation["game_time"][0]
+        assert players_end + 1 == FLAT_OBSERVATION_SIZE
+
+    def test_frame_skip_sums_rewards_and_stops_at_episode_end(self) -> None:
+        # The stand-in rewards 1.0 per tick and truncates after episode_length ticks
+        env = YoloGymEnvironment(episode_length=FRAME_SKIP_EPISODE_LENGTH, frame_skip=FRAME_SKIP)
+        env.reset(seed=0)
+        action = env.action_space.sample()
+
+        _, reward, _, truncated, _ = env.step(action)
+        assert env._yolo_env.step_count == FRAME_SKIP
+        assert reward == float(FRAME_SKIP)
+        assert not truncated
+
+        _, reward, _, truncated, _ = env.step(action)
+        assert env._yolo_env.step_count == FRAME_SKIP_EPISODE_LENGTH
+        assert reward == float(FRAME_SKIP_EPISODE_LENGTH - FRAME_SKIP)
+        assert truncated
+
+    def test_frame_skip_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="frame_skip"):
+            YoloGymEnvironment(frame_skip=0)
+
+    def test_dict_observation_is_copied_in_one_buffer(self) -> None:
+        env = YoloGymEnvironment()
+        observation, _ = env.reset(seed=0)
+        buffers = {id(value.base) for key, value in observation.items() if key != "current_weapon"}
+        assert len(buffers) == 1
+        assert env.observation_space.contains(observation)
+
+    def test_reuse_obs_buffers(self) -> None:
+        env = YoloGymEnvironment(reuse_obs_buffers=True)
+        first, _ = env.reset(seed=0)
+        second, *_ = env.step(env.action_space.sample())
+        assert first is second
+
+
+class TestYoloAutoreset:
+    """Same-step autoreset wrapper and its interaction with TimeLimit."""
+
+    def test_returns_next_episode_with_final_obs(self) -> None:
+        env = YoloAutoreset(YoloGymEnvironment(episode_length=EPISODE_LENGTH))
+        env.reset(seed=0)
+        for _ in range(EPISODE_LENGTH):
+            observation, _, _, truncated, info = env.step(env.action_space.sample())
+        assert truncated
+        assert info["final_obs"]["game_time"][0] == EPISODE_LENGTH
+        assert info["final_info"] == {"rust/kills": 0}
+        assert observation["game_time"][0] == 0.0
+
+    def test_rejects_reused_buffers(self) -> None:
+        with pytest.raises(ValueError, match="reuse_obs_buffers"):
+            YoloAutoreset(YoloGymEnvironment(reuse_obs_buffers=True))
+
+    def test_env_rejects_autoreset_kwarg(self) -> None:
+        with pytest.raises(TypeError, match="YoloAutoreset"):
+            gym.make("YoloGame-Short-v0", autoreset=True)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "episode_steps"),
+        [
+            ({}, gym.spec("YoloGame-Short-Autoreset-v0").max_episode_steps),
+            ({"max_episode_steps": TIME_LIMIT_OVERRIDE}, TIME_LIMIT_OVERRIDE),
+        ],
+    )
+    def test_time_limit_restarts_with_each_episode(self, kwargs: dict, episode_steps: int) -> None:
+        env = gym.make("YoloGame-Short-Autoreset-v0", **kwargs)
+        env.reset(seed=0)
+        truncated_steps = [
+            step for step in range(1, 2 * episode_steps + 2) if env.step(env.action_space.sample())[3]
+        ]
+        assert truncated_steps == [episode_steps, 2 * episode_steps]
+
+
+class TestYoloVectorEnv:
+    """Batched stepping, next-step autoreset and seeding of YoloVectorEnv."""
+
+    def test_make_vec_uses_vector_entry_point(self) -> None:
+        envs = gym.make_vec("YoloGame-Vec-v0", num_envs=3)
+        assert isinstance(envs, YoloVectorEnv)
+        assert envs.max_episode_steps == gym.spec("YoloGame-Vec-v0").max_episode_steps
+
+        observations, _ = envs.reset(seed=0)
+        assert envs.observation_space.contains(observations)
+        observations, rewards, terminations, truncations, infos = envs.step(envs.action_space.sample())
+        assert envs.observation_space.contains(observations)
+        assert rewards.shape == terminations.shape == truncations.shape == (3,)
+        assert infos["_rust/kills"].all()
+        envs.close()
+
+    def test_finished_envs_reset_on_next_step(self) -> None:
+        envs = YoloVectorEnv(2, episode_length=EPISODE_LENGTH)
+        envs.reset(seed=0)
+        actions = envs.action_space.sample()
+
+        for _ in range(EPISODE_LENGTH):
+            observations, _, _, truncations, _ = envs.step(actions)
+        assert truncations.all()
+        assert (observations["game_time"] == EPISODE_LENGTH).all()
+
+        observations, rewards, terminations, truncations, _ = envs.step(actions)
+        assert (observations["game_time"] == 0.0).all()
+        assert not rewards.any()
+        assert not terminations.any()
+        assert not truncations.any()
+        envs.close()
+
+    def test_max_episode_steps_truncates(self) -> None:
+        envs = YoloVectorEnv(2, episode_length=100, max_episode_steps=1)
+        envs.reset(seed=0)
+        _, _, _, truncations, _ = envs.step(envs.action_space.sample())
+        assert truncations.all()
+        envs.close()
+
+    def test_seeded_reset_is_reproducible(self) -> None:
+        first = YoloVectorEnv(2)
+        second = YoloVectorEnv(2)
+        observations, _ = first.reset(seed=7)
+        expected = {key: np.copy(value) for key, value in observations.items()}
+        observations, _ = second.reset(seed=7)
+        for key, value in expected.items():
+            np.testing.assert_array_equal(observations[key], value)
+        # Sub-environments get distinct seeds
+        assert not np.array_equal(expected["player_position"][0], expected["player_position"][1])
+
+    def test_observations_are_not_shared(self) -> None:
+        envs = YoloVectorEnv(2)
+        first, _ = envs.reset(seed=0)
+        second, *_ = envs.step(envs.action_space.sample())
+        for key, value in first.items():
+            assert not np.shares_memory(value, second[key])
+
+    def test_rejects_unknown_kwargs(self) -> None:
+        with pytest.raises(TypeError):
+            YoloVectorEnv(2, flat_action=True)
+
+
+class TestMakeYoloVec:
+    """Keyword validation of the make_yolo_vec factory."""
+
+    def test_sync_uses_registered_defaults(self) -> None:
+        envs = make_yolo_vec(2, asynchronous=False)
+        assert isinstance(envs, YoloVectorEnv)
+        assert envs.max_episode_steps == gym.spec("YoloGame-Vec-v0").max_episode_steps
+
+    def test_sync_rejects_unsupported_kwargs(self) -> None:
+        with pytest.raises(TypeError):
+            make_yolo_vec(2, asynchronous=False, flat_action=True)
+
+    def test_async_rejects_autoreset(self) -> None:
+        with pytest.raises(ValueError, match="autoreset"):
+            make_yolo_vec(2, asynchronous=True, autoreset=True)
+
+
+class TestBuildProfileWarning:
+    """Import-time warning about debug builds of the extension."""
+
+    @staticmethod
+    def _import_fresh_copy(monkeypatch: pytest.MonkeyPatch) -> None:
+        # Import under another name, and skip registration, so the tested module stays untouched
+        monkeypatch.setattr(gym.envs.registration, "register", lambda **_: None)
+        spec = importlib.util.spec_from_file_location("_yolo_gym_env_copy", sys.modules["yolo_gym_env"].__file__)
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+    def test_warns_on_debug_build(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sys.modules["yolo_env"], "__build_profile__", "debug")
+        with pytest.warns(UserWarning, match="release mode"):
+            self._import_fresh_copy(monkeypatch)
+
+    @pytest.mark.parametrize("profile", ["release", None])
+    def test_silent_on_release_or_unknown_build(self, monkeypatch: pytest.MonkeyPatch, profile: str | None) -> None:
+        if profile is None:
+            monkeypatch.delattr(sys.modules["yolo_env"], "__build_profile__")
+        else:
+            monkeypatch.setattr(sys.modules["yolo_env"], "__build_profile__", profile)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self._import_fresh_copy(monkeypatch)
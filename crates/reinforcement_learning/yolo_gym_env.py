@@ -5,18 +5,215 @@ This module provides a standard Gymnasium interface for training RL agents
 in the Yolo multiplayer survival horror game.
 """
 
-from typing import Any
+import math
+import warnings
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any, ClassVar
 
 import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
-from gymnasium.envs.registration import register
+from gymnasium.envs.registration import WrapperSpec, register
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space, create_empty_array
 
 try:
     import yolo_env  # The Rust extension module
 except ImportError:
     print("Warning: yolo_env extension not built. Run 'maturin develop' to build.")
     yolo_env = None
+else:
+    # Debug builds of the extension run the simulation 10-100x slower. Older
+    # builds don't export a profile at all, so only warn on an explicit one
+    _build_profile = getattr(yolo_env, "__build_profile__", None)
+    if _build_profile is not None and _build_profile != "release":
+        warnings.warn(
+            "yolo_env was not built in release mode. "
+            "Run 'maturin develop --release' for production training.",
+            stacklevel=2,
+        )
+
+
+# Fixed sizes of the zero-padded nearby entity observations
+MAX_NEARBY_ENEMIES = 10
+MAX_NEARBY_PLAYERS = 4
+
+# Flat action layout: movement(3), look_direction(2), jump, sprint, fire, reload, switch_weapon
+FLAT_ACTION_SIZE = 10
+# Flat buttons are pressed above this value, switch_weapon is clipped to [0, _MAX_SWITCH_WEAPON]
+_BUTTON_THRESHOLD = 0.5
+_MAX_SWITCH_WEAPON = 4
+
+# Flat observation layout: every field as float32 entries, concatenated in this order
+_FLAT_OBSERVATION_FIELDS = (
+    ("player_position", (3,)),
+    ("player_health", (1,)),
+    ("player_stamina", (1,)),
+    ("current_weapon", (1,)),
+    ("ammo_count", (1,)),
+    ("nearby_enemies", (MAX_NEARBY_ENEMIES, 3)),
+    ("nearby_players", (MAX_NEARBY_PLAYERS, 3)),
+    ("game_time", (1,)),
+)
+FLAT_OBSERVATION_SIZE = sum(math.prod(shape) for _, shape in _FLAT_OBSERVATION_FIELDS)
+
+# Weapon names in current_weapon index order, and the reverse mapping
+_WEAPON_NAMES = ("Pistol", "Rifle", "Shotgun", "Sniper")
+_WEAPON_INDEX = {name: index for index, name in enumerate(_WEAPON_NAMES)}
+
+
+def _make_action_space() -> spaces.Dict:
+    """Build the action space of a single Yolo environment."""
+    # Actions: movement (3D), look_direction (2D), jump, sprint, fire, reload, switch_weapon
+    return spaces.Dict({
+        "movement": spaces.Box(low=-1.0, high=1.0, shape=(3,), dtype=np.float32),
+        "look_direction": spaces.Box(
+            low=np.array([-np.pi, -np.pi/2], dtype=np.float32),
+            high=np.array([np.pi, np.pi/2], dtype=np.float32),
+            shape=(2,),
+            dtype=np.float32,
+        ),
+        "jump": spaces.Discrete(2),
+        "sprint": spaces.Discrete(2),
+        "fire": spaces.Discrete(2),
+        "reload": spaces.Discrete(2),
+        "switch_weapon": spaces.Discrete(5),  # -1, 0, 1, 2, 3 -> mapped to 0, 1, 2, 3, 4
+    })
+
+
+def _make_flat_action_space() -> spaces.Box:
+    """Build the flat action space, packing every action field into one vector."""
+    # Buttons fire above 0.5, switch_weapon is rounded to the Discrete(5) index
+    low = np.array([-1.0, -1.0, -1.0, -np.pi, -np.pi/2, 0.0, 0.0, 0.0, 0.0, 0.0], dtype=np.float32)
+    high = np.array([1.0, 1.0, 1.0, np.pi, np.pi/2, 1.0, 1.0, 1.0, 1.0, _MAX_SWITCH_WEAPON], dtype=np.float32)
+    return spaces.Box(low=low, high=high, shape=(FLAT_ACTION_SIZE,), dtype=np.float32)
+
+
+def _make_observation_space() -> spaces.Dict:
+    """Build the observation space of a single Yolo environment."""
+    return spaces.Dict({
+        "player_position": spaces.Box(low=-np.inf, high=np.inf, shape=(3,), dtype=np.float32),
+        "player_health": spaces.Box(low=0.0, high=100.0, shape=(1,), dtype=np.float32),
+        "player_stamina": spaces.Box(low=0.0, high=100.0, shape=(1,), dtype=np.float32),
+        "current_weapon": spaces.Discrete(4),  # 0=Pistol, 1=Rifle, 2=Shotgun, 3=Sniper
+        "ammo_count": spaces.Box(low=0, high=999, shape=(1,), dtype=np.int32),
+        "nearby_enemies": spaces.Box(low=-np.inf, high=np.inf, shape=(MAX_NEARBY_ENEMIES, 3), dtype=np.float32),
+        "nearby_players": spaces.Box(low=-np.inf, high=np.inf, shape=(MAX_NEARBY_PLAYERS, 3), dtype=np.float32),
+        "game_time": spaces.Box(low=0.0, high=np.inf, shape=(1,), dtype=np.float32),
+    })
+
+
+def _flat_observation_views(buffer: np.ndarray) -> dict[str, np.ndarray]:
+    """Split a flat observation buffer into per-field views, keyed and shaped like the Dict observation."""
+    views = {}
+    offset = 0
+    for key, shape in _FLAT_OBSERVATION_FIELDS:
+        size = math.prod(shape)
+        views[key] = buffer[offset:offset + size].reshape(shape)
+        offset += size
+    return views
+
+
+# (key, dtype, shape, byte offset) of one Dict observation field in a packed byte buffer
+_FieldLayout = tuple[str, np.dtype, tuple[int, ...], int]
+
+
+def _observation_layout(observation_space: spaces.Dict) -> tuple[int, tuple[_FieldLayout, ...]]:
+    """Pack every Box field of the Dict observation into one aligned byte buffer, returning its size and layout."""
+    record = np.dtype(
+        [(key, space.dtype, space.shape) for key, space in observation_space.items() if isinstance(space, spaces.Box)],
+        align=True,
+    )
+    layout = tuple(
+        (key, record.fields[key][0].base, record.fields[key][0].shape, record.fields[key][1]) for key in record.names
+    )
+    return record.itemsize, layout
+
+
+def _buffer_views(buffer: np.ndarray, layout: tuple[_FieldLayout, ...]) -> dict[str, np.ndarray]:
+    """Split a packed observation buffer into per-field views, keyed and shaped like the Dict observation."""
+    return {key: np.ndarray(shape, dtype, buffer, offset) for key, dtype, shape, offset in layout}
+
+
+def _draw_seed(np_random: np.random.Generator) -> int:
+    """Draw the next Rust RNG seed, so unseeded resets stay reproducible from ``np_random``."""
+    return int(np_random.integers(2**32))
+
+
+def _make_observation_writer(out: dict[str, np.ndarray]) -> Callable[["yolo_env.Observation"], int]:
+    """
+    Build a function writing Rust observations in place into ``out``.
+
+    ``out`` holds one array per Box observation key, shaped like a single
+    observation. The writer is specialized to those arrays: they are bound
+    once as closure variables, so each call skips the per-key dict lookups.
+    Enemy and player lists are truncated and zero-padded to the fixed buffer
+    size. The Discrete ``current_weapon`` index is returned instead, for the
+    caller to store.
+    """
+    position = out["player_position"]
+    health = out["player_health"]
+    stamina = out["player_stamina"]
+    ammo = out["ammo_count"]
+    game_time = out["game_time"]
+    enemies = out["nearby_enemies"]
+    players = out["nearby_players"]
+
+    def write(rust_obs: "yolo_env.Observation") -> int:
+        position[:] = rust_obs.player_position
+        health[0] = rust_obs.player_health
+        stamina[0] = rust_obs.player_stamina
+        ammo[0] = rust_obs.ammo_count
+        game_time[0] = rust_obs.game_time
+
+        _write_padded(enemies, rust_obs.nearby_enemies)
+        _write_padded(players, rust_obs.nearby_players)
+
+        # The binding emits the weapon name, mapped to its Discrete(4) index
+        return _WEAPON_INDEX.get(rust_obs.current_weapon, 0)
+
+    return write
+
+
+def _write_padded(buffer: np.ndarray, rows: list[tuple[float, float, float]]) -> None:
+    """Copy position rows into a fixed-size buffer, zeroing the unused tail."""
+    capacity = len(buffer)
+    count = len(rows)
+    if count >= capacity:
+        buffer[:] = rows[:capacity] if count > capacity else rows
+        return
+    if count:
+        buffer[:count] = rows
+    buffer[count:] = 0.0
+
+
+def _fill_rust_action(rust_action: "yolo_env.Action", movement: np.ndarray, look_direction: np.ndarray, *,
+                      jump: int, sprint: int, fire: int, reload: int, switch_weapon: int) -> None:
+    """Copy one Gymnasium action into a reusable Rust action."""
+    # tolist() yields Python floats straight from the float32 buffer, no float64 copy
+    rust_action.movement = tuple(movement.tolist())
+    rust_action.look_direction = tuple(look_direction.tolist())
+    rust_action.jump = bool(jump)
+    rust_action.sprint = bool(sprint)
+    rust_action.fire = bool(fire)
+    rust_action.reload = bool(reload)
+    # Convert switch_weapon from 0-4 to -1-3
+    rust_action.switch_weapon = int(switch_weapon) - 1
+
+
+def _format_ansi(obs: "yolo_env.Observation") -> str:
+    """Format a Rust observation as the text frame of the ANSI render mode."""
+    return f"""
+=== Yolo Game State ===
+Position: ({obs.player_position[0]:.2f}, {obs.player_position[1]:.2f}, {obs.player_position[2]:.2f})
+Health: {obs.player_health:.1f}/100
+Stamina: {obs.player_stamina:.1f}/100
+Weapon: {obs.current_weapon}
+Ammo: {obs.ammo_count}
+Enemies nearby: {len(obs.nearby_enemies)}
+Game time: {obs.game_time:.1f}s
+"""
 
 
 class YoloGymEnvironment(gym.Env):
@@ -25,6 +222,8 @@ class YoloGymEnvironment(gym.Env):
 
     This environment wraps the Rust-based Yolo game to provide a standard
     Gymnasium interface for reinforcement learning training.
+    Observations are filled into preallocated buffers and copied out on
+    return; pass ``reuse_obs_buffers=True`` to skip that copy.
     """
 
     metadata = {
@@ -36,6 +235,11 @@ class YoloGymEnvironment(gym.Env):
                  episode_length: int = 1000,
                  max_episodes: int = 1000,
                  render_mode: str | None = None,
+                 *,
+                 flat_action: bool = False,
+                 frame_skip: int = 1,
+                 flat_obs: bool = False,
+                 reuse_obs_buffers: bool = False,
                  **kwargs) -> None:
         """
         Initialize the Yolo Gymnasium environment.
@@ -44,6 +248,15 @@ class YoloGymEnvironment(gym.Env):
             episode_length: Maximum steps per episode
             max_episodes: Maximum number of episodes
             render_mode: Rendering mode ("human", "rgb_array", "ansi", or None)
+            flat_action: Take actions as one float32 vector of FLAT_ACTION_SIZE entries instead of a dict
+            frame_skip: Number of simulation ticks each step() repeats its action for, summing the rewards
+            flat_obs: Return observations as one float32 vector of FLAT_OBSERVATION_SIZE entries instead of a dict
+            reuse_obs_buffers: Return the internal observation buffers instead of copies. Saves an allocation per
+                step, but every reset/step overwrites the previous observation, which breaks callers that keep
+                observations (env_checker, same-step autoreset, replay buffers)
+
+        Same-step autoreset is done by the ``YoloAutoreset`` wrapper, which must
+        sit outside TimeLimit; use the "-Autoreset" ids to get it from gym.make.
         """
         super().__init__()
 
@@ -56,60 +269,63 @@ class YoloGymEnvironment(gym.Env):
                 msg
             )
 
+        if "autoreset" in kwargs:
+            msg = "autoreset is not a YoloGymEnvironment option, wrap the env in YoloAutoreset instead"
+            raise TypeError(msg)
+
+        if frame_skip < 1:
+            msg = f"frame_skip must be at least 1, got {frame_skip}"
+            raise ValueError(msg)
+
         self.render_mode = render_mode
+        self.flat_action = flat_action
+        self.frame_skip = frame_skip
+        self.flat_obs = flat_obs
+        self.reuse_obs_buffers = reuse_obs_buffers
         self._yolo_env = yolo_env.create_yolo_env(episode_length, max_episodes)
+        # Reused for every step, its fields are overwritten by _convert_action
+        self._rust_action = yolo_env.Action()
+        # Last Rust observation, kept for render()
+        self._last_obs = None
 
-        # Define action space
-        # Actions: movement (3D), look_direction (2D), jump, sprint, fire, reload, switch_weapon
-        self.action_space = spaces.Dict({
-            "movement": spaces.Box(low=-1.0, high=1.0, shape=(3,), dtype=np.float32),
-            "look_direction": spaces.Box(low=[-np.pi, -np.pi/2], high=[np.pi, np.pi/2], shape=(2,), dtype=np.float32),
-            "jump": spaces.Discrete(2),
-            "sprint": spaces.Discrete(2),
-            "fire": spaces.Discrete(2),
-            "reload": spaces.Discrete(2),
-            "switch_weapon": spaces.Discrete(5),  # -1, 0, 1, 2, 3 -> mapped to 0, 1, 2, 3, 4
-        })
-
-        # Define observation space
-        self.observation_space = spaces.Dict({
-            "player_position": spaces.Box(low=-np.inf, high=np.inf, shape=(3,), dtype=np.float32),
-            "player_health": spaces.Box(low=0.0, high=100.0, shape=(1,), dtype=np.float32),
-            "player_stamina": spaces.Box(low=0.0, high=100.0, shape=(1,), dtype=np.float32),
-            "current_weapon": spaces.Discrete(4),  # 0=Pistol, 1=Rifle, 2=Shotgun, 3=Sniper
-            "ammo_count": spaces.Box(low=0, high=999, shape=(1,), dtype=np.int32),
-            "nearby_enemies": spaces.Box(low=-np.inf, high=np.inf, shape=(10, 3), dtype=np.float32),  # Max 10 enemies
-            "nearby_players": spaces.Box(low=-np.inf, high=np.inf, shape=(4, 3), dtype=np.float32),   # Max 4 players
-            "game_time": spaces.Box(low=0.0, high=np.inf, shape=(1,), dtype=np.float32),
-        })
-
-        # Weapon name to index mapping
-        self._weapon_map = {
-            "Pistol": 0,
-            "Rifle": 1,
-            "Shotgun": 2,
-            "Sniper": 3,
-        }
+        self.action_space = _make_flat_action_space() if flat_action else _make_action_space()
+
+        # Persistent observation arrays, refilled in place on every reset/step
+        if flat_obs:
+            self.observation_space = spaces.Box(
+                low=-np.inf, high=np.inf, shape=(FLAT_OBSERVATION_SIZE,), dtype=np.float32
+            )
+            # The per-field arrays are views into the flat buffer, which is copied out on return
+            self._flat_obs_buffer = np.zeros(FLAT_OBSERVATION_SIZE, dtype=np.float32)
+            self._obs_arrays = _flat_observation_views(self._flat_obs_buffer)
+        else:
+            self.observation_space = _make_observation_space()
+            # The per-field arrays are views into one byte buffer, so copying an observation is a single allocation
+            buffer_size, self._obs_layout = _observation_layout(self.observation_space)
+            self._obs_buffer = np.zeros(buffer_size, dtype=np.uint8)
+            self._obs_arrays = _buffer_views(self._obs_buffer, self._obs_layout)
+            self._obs_arrays["current_weapon"] = 0
+        self._write_observation = _make_observation_writer(self._obs_arrays)
 
     def reset(self,
               *,
               seed: int | None = None,
-              options: dict[str, Any] | None = None) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+              options: dict[str, Any] | None = None) -> tuple[
+        dict[str, np.ndarray] | np.ndarray, dict[str, Any]
+    ]:
         """Reset the environment for a new episode."""
         super().reset(seed=seed)
 
-        if seed is not None:
-            # Set random seed in the Rust environment if supported
-            pass
-
-        obs_rust, info_dict = self._yolo_env.reset(seed)
+        # Always hand Rust a seed so it never falls back to OS entropy on reset
+        obs_rust, info = self._yolo_env.reset(seed if seed is not None else _draw_seed(self.np_random))
+        self._last_obs = obs_rust
         observation = self._convert_observation(obs_rust)
-        info = {"rust_info": info_dict}
 
+        # The Rust info dict is returned as is, keyed "rust/<name>"
         return observation, info
 
-    def step(self, action: dict[str, np.ndarray | int]) -> tuple[
-        dict[str, np.ndarray], float, bool, bool, dict[str, Any]
+    def step(self, action: dict[str, np.ndarray | int] | np.ndarray) -> tuple[
+        dict[str, np.ndarray] | np.ndarray, float, bool, bool, dict[str, Any]
     ]:
         """Step the environment with the given action."""
         # Convert Gymnasium action to Rust action
@@ -117,13 +333,19 @@ class YoloGymEnvironment(gym.Env):
 
         # Step the Rust environment
         step_result = self._yolo_env.step(rust_action)
+        reward = step_result.reward
+
+        # Repeat the action for the skipped frames, summing rewards until the episode ends
+        for _ in range(self.frame_skip - 1):
+            if step_result.terminated or step_result.truncated:
+                break
+            step_result = self._yolo_env.step(rust_action)
+            reward += step_result.reward
 
-        # Convert back to Gymnasium format
+        # Convert back to Gymnasium format; the binding already returns float/bool scalars
+        self._last_obs = step_result.observation
         observation = self._convert_observation(step_result.observation)
-        reward = float(step_result.reward)
-        terminated = bool(step_result.terminated)
-        truncated = bool(step_result.truncated)
-        info = {"rust_info": step_result.info}
+        terminated, truncated, info = step_result.terminated, step_result.truncated, step_result.info
 
         return observation, reward, terminated, truncated, info
 
@@ -135,22 +357,14 @@ class YoloGymEnvironment(gym.Env):
         # Call Rust render function
         self._yolo_env.render(self.render_mode)
 
-        if self.render_mode == "ansi":
-            # Return text representation
-            obs = self._yolo_env.get_observation()
-            return f"""
-=== Yolo Game State ===
-Position: ({obs.player_position[0]:.2f}, {obs.player_position[1]:.2f}, {obs.player_position[2]:.2f})
-Health: {obs.player_health:.1f}/100
-Stamina: {obs.player_stamina:.1f}/100
-Weapon: {obs.current_weapon}
-Ammo: {obs.ammo_count}
-Enemies nearby: {len(obs.nearby_enemies)}
-Game time: {obs.game_time:.1f}s
-"""
-        if self.render_mode == "human":
+        if self.render_mode in ("ansi", "human"):
+            # Reuse the observation from the last reset/step instead of fetching a new one over FFI
+            obs = self._last_obs if self._last_obs is not None else self._yolo_env.get_observation()
+            text = _format_ansi(obs)
+            if self.render_mode == "ansi":
+                return text
             # For human mode, print to console
-            print(self.render())
+            print(text)
             return None
         if self.render_mode == "rgb_array":
             # Return a placeholder RGB array (would be actual game frame in real implementation)
@@ -175,47 +389,300 @@ Game time: {obs.game_time:.1f}s
             damage_penalty_scale, death_penalty
         )
 
-    def _convert_observation(self, rust_obs) -> dict[str, np.ndarray]:
-        """Convert Rust observation to Gymnasium observation."""
-        # Pad enemy/player lists to fixed size
-        enemies = np.array(rust_obs.nearby_enemies + [(0.0, 0.0, 0.0)] * (10 - len(rust_obs.nearby_enemies)))[:10]
-        players = np.array(rust_obs.nearby_players + [(0.0, 0.0, 0.0)] * (4 - len(rust_obs.nearby_players)))[:4]
-
-        return {
-            "player_position": np.array(rust_obs.player_position, dtype=np.float32),
-            "player_health": np.array([rust_obs.player_health], dtype=np.float32),
-            "player_stamina": np.array([rust_obs.player_stamina], dtype=np.float32),
-            "current_weapon": self._weapon_map.get(rust_obs.current_weapon, 0),
-            "ammo_count": np.array([rust_obs.ammo_count], dtype=np.int32),
-            "nearby_enemies": enemies.astype(np.float32),
-            "nearby_players": players.astype(np.float32),
-            "game_time": np.array([rust_obs.game_time], dtype=np.float32),
+    def sample_actions(self, n: int) -> Iterator[dict[str, np.ndarray | int] | np.ndarray]:
+        """
+        Draw ``n`` random actions in one batch and yield them one step at a time.
+
+        Cheaper than calling ``action_space.sample()`` every step, which samples
+        each sub-space separately and builds a new dict. The yielded dict is
+        reused between steps; in flat action mode rows of one batch are yielded.
+        """
+        rng = self.np_random
+        if self.flat_action:
+            yield from rng.uniform(self.action_space.low, self.action_space.high, (n, FLAT_ACTION_SIZE)).astype(
+                np.float32
+            )
+            return
+
+        movement_space = self.action_space["movement"]
+        look_space = self.action_space["look_direction"]
+        movement = rng.uniform(movement_space.low, movement_space.high, (n, 3)).astype(np.float32)
+        look_direction = rng.uniform(look_space.low, look_space.high, (n, 2)).astype(np.float32)
+        discrete = {
+            key: rng.integers(0, self.action_space[key].n, n)
+            for key in ("jump", "sprint", "fire", "reload", "switch_weapon")
         }
 
-    def _convert_action(self, gym_action: dict[str, np.ndarray | int]):
+        action: dict[str, np.ndarray | int] = {}
+        for i in range(n):
+            action["movement"] = movement[i]
+            action["look_direction"] = look_direction[i]
+            for key, values in discrete.items():
+                action[key] = values[i]
+            yield action
+
+    def _convert_observation(self, rust_obs) -> dict[str, np.ndarray] | np.ndarray:
+        """
+        Convert Rust observation to Gymnasium observation.
+
+        The observation is written into the persistent buffers, then copied
+        out unless ``reuse_obs_buffers`` is set.
+        """
+        weapon = self._write_observation(rust_obs)
+        if self.flat_obs:
+            # Weapon id is encoded as a float
+            self._obs_arrays["current_weapon"][0] = weapon
+            observation = self._flat_obs_buffer
+        else:
+            self._obs_arrays["current_weapon"] = weapon
+            observation = self._obs_arrays
+        return observation if self.reuse_obs_buffers else self._copy_observation(observation)
+
+    def _copy_observation(self, observation: dict[str, np.ndarray] | np.ndarray) -> dict[str, np.ndarray] | np.ndarray:
+        """Copy an observation out of the persistent buffers."""
+        if self.flat_obs:
+            return observation.copy()
+        copied = _buffer_views(self._obs_buffer.copy(), self._obs_layout)
+        # The Discrete weapon index is a plain int, not part of the buffer
+        copied["current_weapon"] = observation["current_weapon"]
+        return copied
+
+    def _convert_action(self, gym_action: dict[str, np.ndarray | int] | np.ndarray):
         """Convert Gymnasium action to Rust action."""
+        rust_action = self._rust_action
+        if self.flat_action:
+            # Decode the packed vector in one pass, no per-field dict lookups
+            jump, sprint, fire, reload = (gym_action[5:9] > _BUTTON_THRESHOLD).tolist()
+            # Clip out-of-range policy outputs, then round half up (round() would round half to even)
+            switch_weapon = int(np.clip(gym_action[9], 0.0, _MAX_SWITCH_WEAPON) + 0.5)
+            _fill_rust_action(
+                rust_action, gym_action[0:3], gym_action[3:5],
+                jump=jump, sprint=sprint, fire=fire, reload=reload, switch_weapon=switch_weapon,
+            )
+            return rust_action
+
+        _fill_rust_action(
+            rust_action,
+            gym_action["movement"], gym_action["look_direction"],
+            jump=gym_action["jump"], sprint=gym_action["sprint"], fire=gym_action["fire"],
+            reload=gym_action["reload"], switch_weapon=gym_action["switch_weapon"],
+        )
+        return rust_action
+
+
+class YoloAutoreset(gym.Wrapper, gym.utils.RecordConstructorArgs):
+    """
+    Reset a Yolo environment inside ``step()`` as soon as an episode ends.
+
+    Follows Gymnasium's same-step autoreset contract: the returned observation
+    is the first one of the next episode, while the finished episode's last
+    observation and info go in ``info["final_obs"]`` and ``info["final_info"]``.
+    The reset goes through the wrapped stack, so this wrapper must sit outside
+    TimeLimit for the time limit to restart with each episode.
+    """
+
+    def __init__(self, env: gym.Env) -> None:
+        """
+        Wrap ``env`` with same-step autoreset.
+
+        Args:
+            env: Environment to wrap, which must return fresh observations (no ``reuse_obs_buffers``)
+        """
+        if getattr(env.unwrapped, "reuse_obs_buffers", False):
+            msg = "YoloAutoreset keeps the final observation, which reuse_obs_buffers=True would overwrite"
+            raise ValueError(msg)
+        gym.utils.RecordConstructorArgs.__init__(self)
+        gym.Wrapper.__init__(self, env)
+
+    def step(self, action: dict[str, np.ndarray | int] | np.ndarray) -> tuple[
+        dict[str, np.ndarray] | np.ndarray, float, bool, bool, dict[str, Any]
+    ]:
+        """Step the environment, resetting it in the same call when the episode ends."""
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        if terminated or truncated:
+            final_obs, final_info = observation, info
+            observation, info = self.env.reset()
+            info = {**info, "final_obs": final_obs, "final_info": final_info}
+        return observation, reward, terminated, truncated, info
+
+
+class YoloVectorEnv(VectorEnv):
+    """
+    Vectorized Yolo environment stepping ``num_envs`` Rust games in lockstep.
+
+    Batched observations are written in place into buffers allocated once in
+    ``__init__`` (the same preallocation ``SyncVectorEnv`` does), skipping the
+    per-env observation dicts and the concatenation step. Like
+    ``SyncVectorEnv``, the batch is copied out on return unless
+    ``reuse_obs_buffers`` is set. Finished sub-environments are reset on the following ``step`` call.
+    """
+
+    metadata: ClassVar[dict[str, Any]] = {
+        "render_modes": [],
+        "autoreset_mode": AutoresetMode.NEXT_STEP,
+    }
+
+    def __init__(self,
+                 num_envs: int,
+                 episode_length: int = 1000,
+                 max_episodes: int = 1000,
+                 max_episode_steps: int | None = None,
+                 *,
+                 reuse_obs_buffers: bool = False) -> None:
+        """
+        Initialize the vectorized Yolo environment.
+
+        Args:
+            num_envs: Number of Rust game instances to step together
+            episode_length: Maximum steps per episode
+            max_episodes: Maximum number of episodes
+            max_episode_steps: Truncate episodes after this many steps (None to disable)
+            reuse_obs_buffers: Return the internal batch buffers instead of copies; the next reset/step
+                overwrites them
+        """
         if yolo_env is None:
-            msg = "yolo_env not available"
-            raise RuntimeError(msg)
+            msg = (
+                "yolo_env extension not available. "
+                "Please build with 'maturin develop' first."
+            )
+            raise ImportError(
+                msg
+            )
 
-        rust_action = yolo_env.Action()
+        self.num_envs = num_envs
+        self.max_episode_steps = max_episode_steps
+        self.reuse_obs_buffers = reuse_obs_buffers
+        self._yolo_envs = [yolo_env.create_yolo_env(episode_length, max_episodes) for _ in range(num_envs)]
+        self._rust_actions = [yolo_env.Action() for _ in range(num_envs)]
+
+        self.single_action_space = _make_action_space()
+        self.single_observation_space = _make_observation_space()
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+        # Preallocated output buffers, plus per-env writers into their row views
+        self._observations = create_empty_array(self.single_observation_space, n=num_envs, fn=np.zeros)
+        self._observation_writers = [
+            _make_observation_writer({key: array[i] for key, array in self._observations.items()})
+            for i in range(num_envs)
+        ]
+        self._rewards = np.zeros((num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((num_envs,), dtype=np.bool_)
+        self._elapsed_steps = np.zeros((num_envs,), dtype=np.int64)
+        self._autoreset_envs = np.zeros((num_envs,), dtype=np.bool_)
 
-        # Convert numpy arrays to tuples
-        movement = tuple(gym_action["movement"].astype(float))
-        look_direction = tuple(gym_action["look_direction"].astype(float))
+    def reset(self,
+              *,
+              seed: int | list[int | None] | None = None,
+              options: dict[str, Any] | None = None) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Reset all sub-environments."""
+        if seed is None or isinstance(seed, int):
+            super().reset(seed=seed, options=options)
+            seeds = [seed + i if seed is not None else _draw_seed(self.np_random) for i in range(self.num_envs)]
+        else:
+            super().reset(seed=seed[0], options=options)
+            seeds = [env_seed if env_seed is not None else _draw_seed(self.np_random) for env_seed in seed]
+
+        infos: dict[str, Any] = {}
+        for i, (rust_env, env_seed) in enumerate(zip(self._yolo_envs, seeds, strict=True)):
+            obs_rust, info_dict = rust_env.reset(env_seed)
+            self._observations["current_weapon"][i] = self._observation_writers[i](obs_rust)
+            infos = self._add_info(infos, info_dict, i)
+
+        self._elapsed_steps[:] = 0
+        self._autoreset_envs[:] = False
+        return self._batch_observations(), infos
+
+    def step(self, actions: dict[str, np.ndarray]) -> tuple[
+        dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, dict[str, Any]
+    ]:
+        """Step every sub-environment with its row of the batched action."""
+        movement = actions["movement"]
+        look_direction = actions["look_direction"]
+        jump, sprint, fire = actions["jump"], actions["sprint"], actions["fire"]
+        reload, switch_weapon = actions["reload"], actions["switch_weapon"]
+
+        infos: dict[str, Any] = {}
+        for i, rust_env in enumerate(self._yolo_envs):
+            if self._autoreset_envs[i]:
+                obs_rust, info_dict = rust_env.reset(_draw_seed(self.np_random))
+                self._rewards[i] = 0.0
+                self._terminations[i] = False
+                self._truncations[i] = False
+                self._elapsed_steps[i] = 0
+            else:
+                rust_action = self._rust_actions[i]
+                _fill_rust_action(
+                    rust_action, movement[i], look_direction[i],
+                    jump=jump[i], sprint=sprint[i], fire=fire[i], reload=reload[i], switch_weapon=switch_weapon[i],
+                )
+                step_result = rust_env.step(rust_action)
+                obs_rust, info_dict = step_result.observation, step_result.info
+                self._elapsed_steps[i] += 1
+                self._rewards[i] = step_result.reward
+                self._terminations[i] = step_result.terminated
+                self._truncations[i] = step_result.truncated or (
+                    self.max_episode_steps is not None and self._elapsed_steps[i] >= self.max_episode_steps
+                )
+
+            self._observations["current_weapon"][i] = self._observation_writers[i](obs_rust)
+            infos = self._add_info(infos, info_dict, i)
+
+        np.logical_or(self._terminations, self._truncations, out=self._autoreset_envs)
+        return (
+            self._batch_observations(),
+            np.copy(self._rewards),
+            np.copy(self._terminations),
+            np.copy(self._truncations),
+            infos,
+        )
 
-        rust_action.movement = movement
-        rust_action.look_direction = look_direction
-        rust_action.jump = bool(gym_action["jump"])
-        rust_action.sprint = bool(gym_action["sprint"])
-        rust_action.fire = bool(gym_action["fire"])
-        rust_action.reload = bool(gym_action["reload"])
+    def _batch_observations(self) -> dict[str, np.ndarray]:
+        """Return the batched observation, copied out unless ``reuse_obs_buffers`` is set."""
+        if self.reuse_obs_buffers:
+            return self._observations
+        return {key: np.copy(value) for key, value in self._observations.items()}
 
-        # Convert switch_weapon from 0-4 to -1-3
-        switch_weapon_mapped = int(gym_action["switch_weapon"]) - 1
-        rust_action.switch_weapon = switch_weapon_mapped
+    def close_extras(self, **_kwargs: object) -> None:
+        """Close every Rust environment."""
+        for rust_env in getattr(self, "_yolo_envs", []):
+            rust_env.close()
 
-        return rust_action
+
+def make_yolo_vec(num_envs: int, *, asynchronous: bool = True, **kwargs: object) -> VectorEnv:
+    """
+    Create ``num_envs`` Yolo environments behind a single vector interface.
+
+    With ``asynchronous=True`` every environment runs in its own worker
+    process and observations come back through shared memory; Gymnasium
+    batches the Dict observation space (fixed-size padded arrays included)
+    without any custom hook. Each step still pays a pipe round-trip to every
+    worker, so only prefer it once a sim tick measurably costs more than
+    that; otherwise the in-process ``YoloVectorEnv`` is faster.
+
+    Args:
+        num_envs: Number of environments
+        asynchronous: Use worker processes instead of the in-process vector env
+        **kwargs: Forwarded to the environment constructor. The in-process
+            env raises TypeError on options it does not support, and
+            ``autoreset`` is rejected for worker processes, which already
+            reset finished environments on the next step
+    """
+    if not asynchronous:
+        # Built directly rather than through gym.make_vec, which would
+        # swallow its own keywords (wrappers, vector_kwargs, ...)
+        spec = gym.spec("YoloGame-Vec-v0")
+        return YoloVectorEnv(num_envs, **{**spec.kwargs, "max_episode_steps": spec.max_episode_steps, **kwargs})
+
+    if "autoreset" in kwargs:
+        msg = "autoreset is not supported with asynchronous=True: AsyncVectorEnv already autoresets on the next step"
+        raise ValueError(msg)
+
+    return gym.vector.AsyncVectorEnv(
+        [partial(gym.make, "YoloGame-v0", disable_env_checker=True, **kwargs) for _ in range(num_envs)],
+        shared_memory=True,
+    )
 
 
 # Register the environment with Gymnasium
@@ -251,24 +718,77 @@ register(
     }
 )
 
+# Flat action variant, one float32 vector per step instead of a Dict
+register(
+    id="YoloGame-Flat-v0",
+    entry_point="yolo_gym_env:YoloGymEnvironment",
+    max_episode_steps=1000,
+    kwargs={
+        "episode_length": 1000,
+        "max_episodes": 1000,
+        "flat_action": True,
+    }
+)
+
+# Same-step autoreset variants. gym.make applies additional wrappers outside
+# TimeLimit, so the autoreset also restarts the step limit
+_AUTORESET_WRAPPER = WrapperSpec(name="YoloAutoreset", entry_point="yolo_gym_env:YoloAutoreset", kwargs={})
+
+register(
+    id="YoloGame-Autoreset-v0",
+    entry_point="yolo_gym_env:YoloGymEnvironment",
+    max_episode_steps=1000,
+    kwargs={
+        "episode_length": 1000,
+        "max_episodes": 1000,
+    },
+    additional_wrappers=(_AUTORESET_WRAPPER,),
+)
+
+register(
+    id="YoloGame-Short-Autoreset-v0",
+    entry_point="yolo_gym_env:YoloGymEnvironment",
+    max_episode_steps=300,
+    kwargs={
+        "episode_length": 300,
+        "max_episodes": 1000,
+    },
+    additional_wrappers=(_AUTORESET_WRAPPER,),
+)
+
+# Batched variant, created with gym.make_vec("YoloGame-Vec-v0", num_envs=N)
+register(
+    id="YoloGame-Vec-v0",
+    vector_entry_point="yolo_gym_env:YoloVectorEnv",
+    max_episode_steps=1000,
+    kwargs={
+        "episode_length": 1000,
+        "max_episodes": 1000,
+    }
+)
+
 
 if __name__ == "__main__":
     # Simple test of the environment
-    import gymnasium as gym
+    from gymnasium.utils.env_checker import check_env
 
-    # Create environment
-    env = gym.make("YoloGame-v0", render_mode="ansi")
+    # Create the environment directly: gym.make() adds checker wrappers that
+    # run on every call and are only worth it while debugging
+    env = YoloGymEnvironment(episode_length=1000, render_mode="ansi")
 
     print("Action space:", env.action_space)
     print("Observation space:", env.observation_space)
 
-    # Test episode
+    # Run the full API compliance check once up front
+    check_env(env)
     obs, info = env.reset(seed=42)
     print("Initial observation keys:", obs.keys())
 
+    # Pre-sample random actions in one batch
+    sampler = env.sample_actions(10)
+
     for step in range(10):
-        # Sample random action
-        action = env.action_space.sample()
+        action = next(sampler)
         obs, reward, terminated, truncated, info = env.step(action)
 
         print(f"Step {step}: reward={reward:.3f}, terminated={terminated}, truncated={truncated}")